@@ -2,8 +2,23 @@ import random
 import time
 import os
 
+# Events that listeners can subscribe to:
+#   roll(player, rolls)          - dice rolled, as a tuple of values
+#   move(player, steps, position) - move finished at position (steps is 0
+#                                   when the roll would pass the last square)
+#   snake(player, head, tail)    - slid down a snake
+#   ladder(player, bottom, top)  - climbed a ladder
+#   win(player)                  - player reached the last square
+#   turn(player)                 - turn passed to player
+EVENTS = ("roll", "move", "snake", "ladder", "win", "turn")
+
+# Rule variants: "two_dice" (roll two dice, move by one of them) and
+# "optional_ladder" (choose whether to climb a ladder) need a choice each move
+CHOICE_VARIANTS = ("two_dice", "optional_ladder")
+VARIANTS = ("classic",) + CHOICE_VARIANTS
+
 class SnakeAndLadder:
-    def __init__(self):
+    def __init__(self, variant="classic"):
         # Game board size
         self.board_size = 100
         
@@ -45,50 +60,136 @@ class SnakeAndLadder:
         self.game_over = False
         self.winner = None
         
+        # Rule variant, one of VARIANTS
+        if variant not in VARIANTS:
+            raise ValueError(f"Unknown variant: {variant}")
+        self.variant = variant
+        
+        # Bots playing instead of humans (player: bot)
+        self.bots = {}
+        
+        # Makes the choices of players without a bot (play_game installs a ConsoleDecider)
+        self.human_decider = None
+        
+        # Event listeners (event: callbacks). Events are only dispatched when
+        # the list is non-empty, so an engine without listeners runs at full speed.
+        self.listeners = {event: [] for event in EVENTS}
+        
     def setup_players(self, count):
         """Set up the specified number of players"""
         self.player_count = count
         for i in range(1, count + 1):
             self.players[i] = 0  # All players start at position 0 (before the board)
             
+    def set_bot(self, player, bot):
+        """Let a bot make the decisions for the specified player"""
+        self.bots[player] = bot
+        
+    def add_listener(self, event, callback):
+        """Call callback with the event details every time the event happens"""
+        if event not in self.listeners:
+            raise ValueError(f"Unknown event: {event}")
+        self.listeners[event].append(callback)
+        
+    def remove_listener(self, event, callback):
+        """Stop calling callback for the event"""
+        if event not in self.listeners:
+            raise ValueError(f"Unknown event: {event}")
+        self.listeners[event].remove(callback)
+        
+    def notify(self, event, *args):
+        """Call every listener of the event"""
+        for callback in self.listeners[event]:
+            callback(*args)
+            
     def roll_dice(self):
         """Roll a dice and return the value"""
         return random.randint(1, 6)
         
-    def move_player(self, player, steps):
+    def get_landing_position(self, position, steps, take_ladder=True):
+        """Get where a move ends, without moving anyone (same rules as move_player)"""
+        new_pos = position + steps
+        
+        # Can't move beyond the board size
+        if new_pos > self.board_size:
+            return position
+            
+        # Slide down a snake or climb a ladder
+        if new_pos in self.snakes:
+            return self.snakes[new_pos]
+        if new_pos in self.ladders and take_ladder:
+            return self.ladders[new_pos]
+        return new_pos
+        
+    def move_player(self, player, steps, take_ladder=True):
         """Move a player by the specified number of steps"""
         current_pos = self.players[player]
         new_pos = current_pos + steps
         
         # Check if player won
         if new_pos > self.board_size:
-            return current_pos  # Can't move beyond the board size
+            # Can't move beyond the board size
+            if self.listeners["move"]:
+                self.notify("move", player, 0, current_pos)
+            return current_pos
             
         # Check if landed on a snake
         if new_pos in self.snakes:
-            print(f"Oops! Player {player} landed on a snake at {new_pos}!")
-            new_pos = self.snakes[new_pos]
-            print(f"Sliding down to {new_pos}")
+            tail = self.snakes[new_pos]
+            if self.listeners["snake"]:
+                self.notify("snake", player, new_pos, tail)
+            new_pos = tail
             
         # Check if landed on a ladder
-        elif new_pos in self.ladders:
-            print(f"Yay! Player {player} landed on a ladder at {new_pos}!")
-            new_pos = self.ladders[new_pos]
-            print(f"Climbing up to {new_pos}")
+        elif new_pos in self.ladders and take_ladder:
+            top = self.ladders[new_pos]
+            if self.listeners["ladder"]:
+                self.notify("ladder", player, new_pos, top)
+            new_pos = top
             
         # Update player position
         self.players[player] = new_pos
+        if self.listeners["move"]:
+            self.notify("move", player, steps, new_pos)
         
         # Check if player won
         if new_pos == self.board_size:
             self.game_over = True
             self.winner = player
+            if self.listeners["win"]:
+                self.notify("win", player)
             
         return new_pos
         
+    def take_turn(self, player):
+        """Roll for a player, make any choice the variant allows and move them"""
+        decider = self.bots.get(player, self.human_decider)
+        
+        # Roll dice
+        if self.variant == "two_dice":
+            first, second = self.roll_dice(), self.roll_dice()
+            if self.listeners["roll"]:
+                self.notify("roll", player, (first, second))
+            choice = decider.choose_dice(self.players[player], first, second)
+            dice_value = (first, second)[choice]
+        else:
+            dice_value = self.roll_dice()
+            if self.listeners["roll"]:
+                self.notify("roll", player, (dice_value,))
+            
+        # Decide whether to climb a ladder
+        take_ladder = True
+        landing = self.players[player] + dice_value
+        if self.variant == "optional_ladder" and landing in self.ladders:
+            take_ladder = decider.take_ladder(landing)
+            
+        return self.move_player(player, dice_value, take_ladder)
+        
     def next_turn(self):
         """Move to the next player's turn"""
         self.current_player = (self.current_player % self.player_count) + 1
+        if self.listeners["turn"]:
+            self.notify("turn", self.current_player)
         
     def display_board(self):
         """Display the game board with player positions"""
@@ -134,35 +235,102 @@ class SnakeAndLadder:
         self.setup_players(num_players)
         self.current_player = 1
         
+        # Show the game and ask for choices on the console
+        ConsoleUI(self)
+        self.human_decider = ConsoleDecider(self)
+        self.notify("turn", self.current_player)
+        
         # Main game loop
         while not self.game_over:
-            self.display_board()
-            
-            print(f"\nPlayer {self.current_player}'s turn")
-            input("Press Enter to roll the dice...")
-            
-            # Roll dice
-            dice_value = self.roll_dice()
-            print(f"Player {self.current_player} rolled a {dice_value}")
+            if self.current_player not in self.bots:
+                input("Press Enter to roll the dice...")
             
-            # Move player
-            new_pos = self.move_player(self.current_player, dice_value)
-            print(f"Player {self.current_player} moved to position {new_pos}")
+            # Roll dice and move player
+            self.take_turn(self.current_player)
             
-            # Check if game is over
-            if self.game_over:
-                break
-                
             # Next player's turn
-            self.next_turn()
-            
-            # Pause for readability
-            time.sleep(1)
+            if not self.game_over:
+                self.next_turn()
+        
+    def play_bot_game(self):
+        """Play a full game between bots without display or pauses, returning the winner"""
+        # Choices can only be made by bots here
+        if self.variant != "classic":
+            for player in self.players:
+                if player not in self.bots:
+                    raise ValueError(f"Player {player} has no bot for the {self.variant} variant")
+                    
+        self.current_player = 1
+        while not self.game_over:
+            self.take_turn(self.current_player)
+            if not self.game_over:
+                self.next_turn()
+        return self.winner
+        
+class ConsoleUI:
+    def __init__(self, game, pause=1.0):
+        self.game = game
+        self.pause = pause  # Seconds to wait between turns for readability
+        self.first_turn = True
+        
+        # Subscribe to every game event
+        for event in EVENTS:
+            game.add_listener(event, getattr(self, "on_" + event))
             
-        # Game over
-        self.display_board()
-        print(f"\nGame Over! Player {self.winner} wins!")
+    def on_roll(self, player, rolls):
+        """Show the dice rolled"""
+        print(f"Player {player} rolled a " + " and a ".join(str(value) for value in rolls))
         
+    def on_move(self, player, steps, position):
+        """Show where the player ended up"""
+        if steps == 0:
+            print(f"Player {player} can't move past {self.game.board_size}, staying at position {position}")
+        else:
+            print(f"Player {player} moved {steps} to position {position}")
+        
+    def on_snake(self, player, head, tail):
+        """Show a snake bite"""
+        print(f"Oops! Player {player} landed on a snake at {head}!")
+        print(f"Sliding down to {tail}")
+        
+    def on_ladder(self, player, bottom, top):
+        """Show a ladder climb"""
+        print(f"Yay! Player {player} landed on a ladder at {bottom}!")
+        print(f"Climbing up to {top}")
+        
+    def on_win(self, player):
+        """Show the final board and the winner"""
+        self.game.display_board()
+        print(f"\nGame Over! Player {player} wins!")
+        
+    def on_turn(self, player):
+        """Pause, then show the board for the next player"""
+        if not self.first_turn:
+            time.sleep(self.pause)
+        self.first_turn = False
+        self.game.display_board()
+        print(f"\nPlayer {player}'s turn")
+        
+class ConsoleDecider:
+    def __init__(self, game):
+        self.game = game
+        
+    def choose_dice(self, position, first, second):
+        """Ask a human player which dice to move by, returning 0 or 1"""
+        while True:
+            answer = input(f"Move by {first} or {second}? (1/2): ").strip()
+            if answer in ("1", "2"):
+                return int(answer) - 1
+            print("Please enter 1 or 2.")
+            
+    def take_ladder(self, position):
+        """Ask a human player whether to climb the ladder at a position"""
+        while True:
+            answer = input(f"Climb the ladder at {position} to {self.game.ladders[position]}? (y/n): ").strip().lower()
+            if answer in ("y", "n"):
+                return answer == "y"
+            print("Please enter y or n.")
+            
 # Run the game if this script is executed directly
 if __name__ == "__main__":
     game = SnakeAndLadder()
@@ -0,0 +1,230 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import timeit
+import tracemalloc
+
+from SnakeAndLadder import SnakeAndLadder
+
+# Regressions smaller than this fraction are treated as noise
+DEFAULT_THRESHOLD = 0.10
+
+def time_call(func, number, repeat):
+    """Return the best time per call in nanoseconds"""
+    best = min(timeit.repeat(func, number=number, repeat=repeat))
+    return best / number * 1e9
+
+def result(value, unit, higher_is_better=False):
+    """Build a single benchmark result"""
+    return {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+
+def play_one_game(player_count, listener=None):
+    """Play a classic game without display, calling listener on every turn change"""
+    game = SnakeAndLadder()
+    game.setup_players(player_count)
+    if listener is not None:
+        game.add_listener("turn", listener)
+    game.play_bot_game()
+
+def count_turns(games, player_count):
+    """Count the turns played in the seeded games, outside of any timing"""
+    random.seed(0)
+    turn_changes = []
+    for _ in range(games):
+        play_one_game(player_count, turn_changes.append)
+
+    # Every turn but the winning one passes the turn on
+    return len(turn_changes) + games
+
+def bench_engine(number, repeat, games):
+    """Benchmark the hot paths of the text-based engine"""
+    results = {}
+    game = SnakeAndLadder()
+    game.setup_players(4)
+    game.current_player = 1
+
+    def move_plain():
+        game.players[1] = 0
+        game.move_player(1, 2)
+
+    def move_snake():
+        game.players[1] = 10
+        game.move_player(1, 6)
+
+    def move_ladder():
+        game.players[1] = 15
+        game.move_player(1, 6)
+
+    # Same move with a listener attached, to measure the cost of dispatch
+    observed = SnakeAndLadder()
+    observed.setup_players(4)
+    observed.add_listener("move", lambda player, steps, position: None)
+
+    def move_observed():
+        observed.players[1] = 0
+        observed.move_player(1, 2)
+
+    results["engine.move_player"] = result(time_call(move_plain, number, repeat), "ns/call")
+    results["engine.move_player_snake"] = result(time_call(move_snake, number, repeat), "ns/call")
+    results["engine.move_player_ladder"] = result(time_call(move_ladder, number, repeat), "ns/call")
+    results["engine.move_player_listener"] = result(time_call(move_observed, number, repeat), "ns/call")
+    results["engine.next_turn"] = result(time_call(game.next_turn, number, repeat), "ns/call")
+    results["engine.roll_dice"] = result(time_call(game.roll_dice, number, repeat), "ns/call")
+
+    # Full-game throughput without listeners, keeping the best of several runs.
+    # The seed is fixed, so every run plays the games that were counted.
+    turns = count_turns(games, 2)
+    best_games = best_turns = 0.0
+    for _ in range(repeat):
+        random.seed(0)
+        start = time.perf_counter()
+        for _ in range(games):
+            play_one_game(2)
+        elapsed = time.perf_counter() - start
+        best_games = max(best_games, games / elapsed)
+        best_turns = max(best_turns, turns / elapsed)
+    results["game.games_per_sec"] = result(best_games, "games/s", higher_is_better=True)
+    results["game.turns_per_sec"] = result(best_turns, "turns/s", higher_is_better=True)
+
+    # Peak memory allocated while creating and playing one game
+    random.seed(0)
+    samples = min(games, 50)
+    peak_total = 0
+    for _ in range(samples):
+        tracemalloc.start()
+        play_one_game(2)
+        peak_total += tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    results["game.memory_per_game"] = result(peak_total / samples, "bytes")
+
+    return results
+
+def bench_visual(number, repeat):
+    """Benchmark the coordinate helpers and history seeking of the graphical version"""
+    # Run pygame without opening a window
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    try:
+        from SnakeAndLadderVisual import SnakeAndLadderGame, Player, CHECKPOINT_INTERVAL
+    except ImportError:
+        print("pygame is not installed, skipping visual benchmarks", file=sys.stderr)
+        return {}
+
+    results = {}
+    game = SnakeAndLadderGame()
+    player = Player(1, (255, 0, 0))
+    player.position = 57
+    head = game.get_position_coordinates(87)
+    tail = game.get_position_coordinates(24)
+
+    # Record a long game history to seek in
+    random.seed(0)
+    game.setup_players(4)
+    for turn in range(5000):
+        mover = game.players[turn % 4]
+        game.dice_value = random.randint(1, 6)
+        mover.position = game.get_landing_position(mover.position, game.dice_value)
+        game.record_turn()
+    worst_turn = 2500 // CHECKPOINT_INTERVAL * CHECKPOINT_INTERVAL + CHECKPOINT_INTERVAL - 1  # Furthest from a checkpoint
+
+    results["visual.get_position_coordinates"] = result(
+        time_call(lambda: game.get_position_coordinates(57), number, repeat), "ns/call")
+    results["visual.get_curve_points"] = result(
+        time_call(lambda: game.get_curve_points(head, tail, 0.3, 5), number, repeat), "ns/call")
+    results["visual.update_coordinates"] = result(
+        time_call(lambda: player.update_coordinates(game.board_x, game.board_y), number, repeat), "ns/call")
+    results["visual.seek"] = result(
+        time_call(lambda: game.seek(worst_turn), max(1, number // 10), repeat), "ns/call")
+    return results
+
+def run_benchmarks(number=100000, repeat=5, games=2000, visual=True):
+    """Run every benchmark and return the results with environment details"""
+    results = bench_engine(number, repeat, games)
+    if visual:
+        results.update(bench_visual(number, repeat))
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """Print how current results differ from a baseline and return the regressed or missing names"""
+    regressions = []
+    print(f"{'benchmark':36} {'baseline':>14} {'current':>14} {'change':>8}")
+    for name, base in baseline["results"].items():
+        if name not in current["results"]:
+            print(f"{name:36} {base['value']:14.1f} {'missing':>14}  MISSING")
+            regressions.append(name)
+            continue
+        value = current["results"][name]["value"]
+        change = (value - base["value"]) / base["value"] if base["value"] else 0.0
+
+        # A positive change is worse when lower values are better
+        worse = -change if base["higher_is_better"] else change
+        flag = ""
+        if worse > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif worse < -threshold:
+            flag = "  improved"
+        print(f"{name:36} {base['value']:14.1f} {value:14.1f} {change:+8.1%}{flag}")
+
+    # Results with nothing to compare against yet
+    for name, res in current["results"].items():
+        if name not in baseline["results"]:
+            print(f"{name:36} {'new':>14} {res['value']:14.1f}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks for the Snake and Ladder game")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("-o", "--output", help="save the results as a JSON baseline")
+
+    compare_parser = subparsers.add_parser("compare", help="compare results against a baseline")
+    compare_parser.add_argument("baseline", help="baseline JSON file")
+    compare_parser.add_argument("current", nargs="?", help="results JSON file (runs the benchmarks if omitted)")
+    compare_parser.add_argument("-t", "--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="fraction of change treated as a regression (default 0.10)")
+
+    for sub in (run_parser, compare_parser):
+        sub.add_argument("--number", type=int, default=100000, help="calls per micro-benchmark run")
+        sub.add_argument("--repeat", type=int, default=5, help="runs per benchmark, the best is kept")
+        sub.add_argument("--games", type=int, default=2000, help="games per throughput run")
+        sub.add_argument("--no-visual", action="store_true", help="skip the pygame benchmarks")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        data = run_benchmarks(args.number, args.repeat, args.games, not args.no_visual)
+        for name, res in data["results"].items():
+            print(f"{name:36} {res['value']:14.1f} {res['unit']}")
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(data, f, indent=2)
+            print(f"Saved results to {args.output}")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if args.current:
+        with open(args.current) as f:
+            current = json.load(f)
+    else:
+        current = run_benchmarks(args.number, args.repeat, args.games, not args.no_visual)
+
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%} or missing result(s)")
+        return 1
+    print(f"\nNo regressions beyond {args.threshold:.0%}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+from SnakeAndLadder import SnakeAndLadder, CHOICE_VARIANTS
+
+class Policy:
+    def __init__(self, variant, board_size, values, table):
+        self.variant = variant
+        self.board_size = board_size
+
+        # Expected number of turns to finish from each position
+        self.values = values
+
+        # Decision table, one byte per decision:
+        #   two_dice: index position * 36 + (first - 1) * 6 + (second - 1),
+        #             0 to move by the first dice, 1 for the second
+        #   optional_ladder: index position, 1 to climb the ladder there
+        self.table = table
+
+    def choose_dice(self, position, first, second):
+        """Return 0 to move by the first dice or 1 to move by the second"""
+        if self.variant != "two_dice":
+            raise ValueError(f"A {self.variant} policy can't choose dice")
+        return self.table[position * 36 + (first - 1) * 6 + (second - 1)]
+
+    def take_ladder(self, position):
+        """Return whether to climb the ladder at a position"""
+        if self.variant != "optional_ladder":
+            raise ValueError(f"A {self.variant} policy can't decide on ladders")
+        return self.table[position] == 1
+
+def solve_policy(game, tolerance=1e-9, max_iterations=10000):
+    """Compute the policy minimizing the expected number of turns using value iteration
+
+    The policy is solved for the layout and variant of the game, and follows
+    its rules through SnakeAndLadder.get_landing_position.
+    """
+    variant = game.variant
+    board_size = game.board_size
+    if variant not in CHOICE_VARIANTS:
+        raise ValueError(f"Unknown choice variant: {variant}")
+
+    # Precompute the reachable positions for every move
+    if variant == "two_dice":
+        # outcomes[position][steps - 1] is where moving by steps ends
+        outcomes = [[game.get_landing_position(p, d) for d in range(1, 7)]
+                    for p in range(board_size + 1)]
+    else:
+        # outcomes[position][steps - 1] lists where moving by steps can end
+        outcomes = []
+        for p in range(board_size + 1):
+            moves = []
+            for d in range(1, 7):
+                climb = game.get_landing_position(p, d)
+                stay = game.get_landing_position(p, d, take_ladder=False)
+                moves.append((climb, stay) if climb != stay else (climb,))
+            outcomes.append(moves)
+
+    # Value iteration, updating in place (Gauss-Seidel) for faster convergence
+    values = [0.0] * (board_size + 1)
+    for _ in range(max_iterations):
+        delta = 0.0
+        for p in range(board_size - 1, -1, -1):
+            moves = outcomes[p]
+            if variant == "two_dice":
+                best = [values[q] for q in moves]
+                total = 0.0
+                for a in best:
+                    for b in best:
+                        total += a if a < b else b
+                new_value = 1.0 + total / 36
+            else:
+                total = 0.0
+                for ends in moves:
+                    total += min(values[q] for q in ends)
+                new_value = 1.0 + total / 6
+            change = abs(new_value - values[p])
+            if change > delta:
+                delta = change
+            values[p] = new_value
+        if delta < tolerance:
+            break
+
+    # Store the greedy decisions as a compact lookup table
+    if variant == "two_dice":
+        table = bytearray((board_size + 1) * 36)
+        for p in range(board_size + 1):
+            moves = outcomes[p]
+            for first in range(6):
+                for second in range(6):
+                    if values[moves[second]] < values[moves[first]]:
+                        table[p * 36 + first * 6 + second] = 1
+    else:
+        table = bytearray(board_size + 1)
+        for bottom, top in game.ladders.items():
+            table[bottom] = 1 if values[top] <= values[bottom] else 0
+
+    return Policy(variant, board_size, values, table)
+
+def run_batch(games, player_count=2, variant="two_dice", policy=None):
+    """Play many games between policy bots and return the number of wins per player"""
+    wins = {player: 0 for player in range(1, player_count + 1)}
+
+    # Solve once for the layout and share the policy between all games
+    if policy is None:
+        policy = solve_policy(SnakeAndLadder(variant))
+
+    for _ in range(games):
+        game = SnakeAndLadder(variant)
+        game.setup_players(player_count)
+        for player in game.players:
+            game.set_bot(player, policy)
+        wins[game.play_bot_game()] += 1
+
+    return wins
+
+# Solve the default layout and play a batch of games between bots
+if __name__ == "__main__":
+    for variant in CHOICE_VARIANTS:
+        policy = solve_policy(SnakeAndLadder(variant))
+        print(f"{variant}: expected turns from the start {policy.values[0]:.2f}")
+        print(f"{variant}: wins over 1000 games {run_batch(1000, 2, variant, policy)}")
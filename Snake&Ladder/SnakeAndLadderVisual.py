@@ -14,6 +14,7 @@ BOARD_SIZE = 500
 GRID_SIZE = 10  # 10x10 grid
 CELL_SIZE = BOARD_SIZE // GRID_SIZE
 FPS = 60
+CHECKPOINT_INTERVAL = 32  # Turns between history checkpoints
 
 # Colors
 WHITE = (255, 255, 255)
@@ -211,14 +212,25 @@ class SnakeAndLadderGame:
         self.small_font = pygame.font.SysFont(None, 24)
         
         # Game state
-        self.state = "setup"  # setup, playing, game_over
+        self.state = "setup"  # setup, playing, game_over, review
         self.player_count = 2  # Default
         
+        # History: the dice value of every turn, plus the player positions
+        # every CHECKPOINT_INTERVAL turns so any turn can be restored quickly
+        self.history = bytearray()
+        self.checkpoints = []
+        self.view_turn = 0
+        self.review_return_state = None
+        self.review_return_dice = 1
+        
     def setup_players(self, count):
         """Set up the specified number of players"""
         self.players = []
         for i in range(1, count + 1):
             self.players.append(Player(i, PLAYER_COLORS[i-1]))
+        self.history = bytearray()
+        self.checkpoints = [self.get_positions()]
+        self.view_turn = 0
             
     def roll_dice(self):
         """Roll the dice"""
@@ -269,6 +281,61 @@ class SnakeAndLadderGame:
             return True
         return False
         
+    def get_positions(self):
+        """Get the positions of all players"""
+        return tuple(player.position for player in self.players)
+        
+    def get_landing_position(self, position, steps):
+        """Get where a move ends, following snakes and ladders like the animation does"""
+        position = min(position + steps, 100)
+        while position in self.snakes or position in self.ladders:
+            position = self.snakes.get(position) or self.ladders[position]
+        return position
+        
+    def record_turn(self):
+        """Add the finished turn to the history"""
+        self.history.append(self.dice_value)
+        if len(self.history) % CHECKPOINT_INTERVAL == 0:
+            self.checkpoints.append(self.get_positions())
+        self.view_turn = len(self.history)
+        
+    def seek(self, turn):
+        """Show the board as it was after the specified number of turns"""
+        turn = max(0, min(turn, len(self.history)))
+        
+        # Restore the nearest checkpoint and replay the turns after it
+        index = turn // CHECKPOINT_INTERVAL
+        positions = list(self.checkpoints[index])
+        for t in range(index * CHECKPOINT_INTERVAL, turn):
+            i = t % len(positions)
+            positions[i] = self.get_landing_position(positions[i], self.history[t])
+            
+        for player, position in zip(self.players, positions):
+            player.position = position
+            player.target_position = position
+            player.moving = False
+            player.move_progress = 0
+            player.update_coordinates(self.board_x, self.board_y)
+        # Show the roll that led to this turn, or a fresh die at the start
+        self.dice.value = self.history[turn - 1] if turn > 0 else 1
+        self.view_turn = turn
+        
+    def enter_review(self):
+        """Start reviewing the history from the last turn"""
+        if not self.history:
+            return
+        self.review_return_state = self.state
+        self.review_return_dice = self.dice.value
+        self.message = ""  # Keep the turn label clear
+        self.state = "review"
+        self.seek(len(self.history) - 1)
+        
+    def exit_review(self):
+        """Return to the live game"""
+        self.seek(len(self.history))
+        self.state = self.review_return_state
+        self.dice.value = self.review_return_dice
+        
     def show_message(self, text):
         """Show a message for a duration"""
         self.message = text
@@ -441,6 +508,8 @@ class SnakeAndLadderGame:
             # Highlight current player
             if i == self.current_player and self.state == "playing":
                 pygame.draw.circle(self.screen, BLACK, (20, y_pos), 12, 2)
+            elif self.state == "review" and self.view_turn > 0 and i == (self.view_turn - 1) % len(self.players):
+                pygame.draw.circle(self.screen, BLACK, (20, y_pos), 12, 2)
                 
         # Draw dice
         self.dice.draw(self.screen)
@@ -455,6 +524,20 @@ class SnakeAndLadderGame:
         if self.state == "playing" and not self.dice_rolled:
             text = self.small_font.render("Press SPACE to roll dice", True, BLACK)
             self.screen.blit(text, (SCREEN_WIDTH - 200, SCREEN_HEIGHT - 30))
+            if self.history:
+                text2 = self.small_font.render("Press LEFT to review turns", True, BLACK)
+                self.screen.blit(text2, (SCREEN_WIDTH - 200, SCREEN_HEIGHT - 55))
+            
+        elif self.state == "review":
+            text = self.font.render(f"Turn {self.view_turn} / {len(self.history)}", True, BLACK)
+            text2 = self.small_font.render("LEFT/RIGHT: 1 turn, UP/DOWN: 10 turns, HOME/END, ESC to return",
+                                           True, BLACK)
+            
+            text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 30))
+            text2_rect = text2.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 20))
+            
+            self.screen.blit(text, text_rect)
+            self.screen.blit(text2, text2_rect)
             
         elif self.state == "setup":
             text1 = self.font.render("Select number of players:", True, BLACK)
@@ -467,7 +550,7 @@ class SnakeAndLadderGame:
             
         elif self.state == "game_over":
             text = self.font.render(f"Player {self.winner.id} wins!", True, BLACK)
-            text2 = self.small_font.render("Press R to play again", True, BLACK)
+            text2 = self.small_font.render("Press R to play again, LEFT to review", True, BLACK)
             
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20))
             text2_rect = text2.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
@@ -494,12 +577,34 @@ class SnakeAndLadderGame:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE and not self.dice_rolled:
                 self.roll_dice()
+            elif event.key == pygame.K_LEFT and not self.dice_rolled:
+                self.enter_review()
                 
     def handle_game_over_input(self, event):
         """Handle input during game over phase"""
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_r:
                 self.__init__()  # Reset the game
+            elif event.key == pygame.K_LEFT:
+                self.enter_review()
+                
+    def handle_review_input(self, event):
+        """Handle input while reviewing the history"""
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_LEFT:
+                self.seek(self.view_turn - 1)
+            elif event.key == pygame.K_RIGHT:
+                self.seek(self.view_turn + 1)
+            elif event.key == pygame.K_DOWN:
+                self.seek(self.view_turn - 10)
+            elif event.key == pygame.K_UP:
+                self.seek(self.view_turn + 10)
+            elif event.key == pygame.K_HOME:
+                self.seek(0)
+            elif event.key == pygame.K_END:
+                self.seek(len(self.history))
+            elif event.key == pygame.K_ESCAPE:
+                self.exit_review()
                 
     def run(self):
         """Main game loop"""
@@ -518,6 +623,8 @@ class SnakeAndLadderGame:
                     self.handle_playing_input(event)
                 elif self.state == "game_over":
                     self.handle_game_over_input(event)
+                elif self.state == "review":
+                    self.handle_review_input(event)
                     
             # Update
             if self.state == "playing":
@@ -537,6 +644,7 @@ class SnakeAndLadderGame:
                     if player.update():
                         # Player finished moving
                         if not self.check_snake_or_ladder():
+                            self.record_turn()
                             if not self.check_winner():
                                 self.next_turn()
                                 